@@ -0,0 +1,31 @@
+"""
+Vote validation benchmark (opt-in, not part of the test suite).
+
+Run from the repository root:
+    python -m benchmarks.bench_models
+"""
+import timeit
+
+from src.models import Vote, VOTES_ADAPTER
+
+VOTE = {"user_type": "squad", "hours": 24.0, "tech_complexity": 5, "manual_effort": 3, "uncertainty": 8}
+BATCH_SIZE = 1000
+RUNS = 20
+
+# Target from the validation layer request: microseconds per vote
+TARGET_MICROSECONDS_PER_VOTE = 10.0
+
+
+def main() -> None:
+    batch = [VOTE] * BATCH_SIZE
+    single = timeit.timeit(lambda: Vote.model_validate(VOTE), number=RUNS * BATCH_SIZE) / (RUNS * BATCH_SIZE)
+    bulk = timeit.timeit(lambda: VOTES_ADAPTER.validate_python(batch), number=RUNS) / (RUNS * BATCH_SIZE)
+
+    for label, seconds in [("Vote.model_validate", single), (f"TypeAdapter (batch of {BATCH_SIZE})", bulk)]:
+        micros = seconds * 1e6
+        status = "ok" if micros < TARGET_MICROSECONDS_PER_VOTE else "ABOVE TARGET"
+        print(f"{label}: {micros:.2f} µs/vote [{status}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,16 @@ import plotly.express as px
 
 
 from src.config import METRICS_CONFIG
+from src.resources import get_scoring_registry
 
 st.set_page_config(page_title="EuSEI - Metodologia", layout="wide")
 
+# Documentação sempre reflete o modelo de pontuação ativo
+scoring_registry = get_scoring_registry()
+scoring_registry.refresh()
+active_model = scoring_registry.active
+MAX_HOURS = active_model.max_hours
+
 st.title("📖 Guia de Referência e Escalas")
 
 # --- Subseção: Escala de Complexidade (1-10) ---
@@ -44,9 +51,7 @@ as horas são normalizadas em relação ao teto de capacidade da Sprint.
 
 with st.container(border=True):
     col_h1, col_h2 = st.columns([1, 2])
-    # Puxamos o valor MAX_HOURS diretamente do seu arquivo de cálculo
-    from src.calculator import MAX_HOURS
-    
+    # MAX_HOURS vem do modelo de pontuação ativo
     col_h1.metric("Capacidade Máxima (Teto)", f"{MAX_HOURS}h")
     col_h2.info(f"""
     **Como estimar:** - Considere apenas o tempo de 'mão na massa'.
@@ -76,13 +81,14 @@ O cálculo segue três etapas fundamentais:
 """)
 
 # Exibição da Fórmula em LaTeX
-st.latex(r"Score = (\sum_{i=1}^{n} \text{valor}_i \times \text{peso}_i)^{1.5}")
+st.latex(rf"Score = (\sum_{{i=1}}^{{n}} \text{{valor}}_i \times \text{{peso}}_i)^{{{active_model.curve_exponent}}}")
+st.caption(f"Modelo de pontuação ativo: v{active_model.version}")
 
 # --- 2. Distribuição de Pesos ---
 st.subheader("⚖️ Pesos dos Critérios")
 df_weights = pd.DataFrame([
-    {"Critério": v["display_name"], "Peso": v["weight"]} 
-    for k, v in METRICS_CONFIG.items()
+    {"Critério": METRICS_CONFIG[k]["display_name"], "Peso": w}
+    for k, w in active_model.weights.items()
 ])
 fig = px.pie(df_weights, values='Peso', names='Critério', hole=.3, 
              title="Impacto de cada métrica no Score Final")
@@ -114,7 +120,7 @@ seja visualmente menor do que a diferença entre 'Difícil' e 'Crítica'.
 """)
 
 x = np.linspace(0, 10, 100)
-y = np.power(x, 1.5)
+y = np.power(x, active_model.curve_exponent)
 df_curve = pd.DataFrame({"Base (Média Ponderada)": x, "Resultado Final (EuSEI)": y})
 fig_curve = px.line(df_curve, x="Base (Média Ponderada)", y="Resultado Final (EuSEI)")
 st.plotly_chart(fig_curve, use_container_width=True)
\ No newline at end of file
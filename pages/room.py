@@ -9,6 +9,10 @@ from typing import Tuple
 # Mantendo suas importações de lógica de negócio
 from src.calculator import ComplexityCalculator
 from src.config import METRICS_CONFIG, DISCRETE_SCALE
+from src.scoring import DEFAULT_MODEL_VERSION
+from src.resources import get_scoring_registry, get_rescore_jobs
+from src.models import Vote, validate_votes
+from pydantic import ValidationError
 
 st.set_page_config(page_title="EuSEI - Sala Virtual", layout="wide")
 
@@ -30,7 +34,7 @@ def rename_cols(df: pd.DataFrame, new_cols: list):
 def get_room_report(room_ref, report_type="Completo"):
     """
     Gera o relatório baseado na escolha do usuário.
-    'Completo': Todos os votos de todos os usuários.
+    'Completo': Todos os votos de todos os usuários (votos inválidos saem com valid=False).
     'Médias por Tarefa': Apenas os resultados finais de cada task.
     """
     all_rows = []
@@ -41,11 +45,15 @@ def get_room_report(room_ref, report_type="Completo"):
         task_data = task.to_dict()
         
         if report_type == "Completo":
-            votes = task.reference.collection("votes").stream()
-            for vote in votes:
-                data = vote.to_dict()
+            vote_docs = list(task.reference.collection("votes").stream())
+            votes, rejected = validate_votes([vote.to_dict() for vote in vote_docs])
+            valid_votes = iter(votes)
+            for i, doc in enumerate(vote_docs):
+                # Votos rejeitados entram crus e sinalizados, para o CSV não omitir nada
+                data = doc.to_dict() if i in rejected else next(valid_votes).model_dump()
+                data['valid'] = i not in rejected
                 data['task_id'] = task_id
-                data['voter_name'] = vote.id
+                data['voter_name'] = doc.id
                 all_rows.append(data)
         else:
             # Puxa apenas o nó de 'results' definido no seu schema
@@ -55,6 +63,7 @@ def get_room_report(room_ref, report_type="Completo"):
                     'task_id': task_id,
                     'status': results.get('status'),
                     'total_average': results.get('averages', {}).get('total_average'),
+                    'model_version': results.get('model_version', DEFAULT_MODEL_VERSION),
                     **results.get('averages', {}) # Explode as médias individuais
                 }
                 all_rows.append(row)
@@ -76,6 +85,11 @@ def get_db_client() -> firestore.Client:
 
 db = get_db_client()
 
+# Registro compartilhado entre sessões; refresh() carrega novos arquivos de modelo sem restart
+scoring_registry = get_scoring_registry()
+scoring_registry.refresh()
+rescore_jobs = get_rescore_jobs()
+
 # Definição das referências baseadas no novo Schema
 room_id = st.session_state.get("room_id")
 user_name = st.session_state.get("user_name")
@@ -91,12 +105,15 @@ votes_ref = task_ref.collection("votes")
 
 def save_final_results(votes_dict: dict):
     """Calcula as médias e salva no campo 'results' da task."""
-    calc = ComplexityCalculator(weights=METRICS_CONFIG)
+    calc = ComplexityCalculator(model=scoring_registry.active)
     
-    # 1. Calcular Médias por critério
+    # 1. Calcular Médias por critério (votos já validados, sem 'user_type')
+    metrics = [v.metrics() for v in votes_dict.values()]
     averages = {}
     for key in METRICS_CONFIG.keys():
-        averages[key] = np.mean([v[key] for v in votes_dict.values()])
+        values = [m[key] for m in metrics if key in m]
+        if values:
+            averages[key] = float(np.mean(values))
     
     # 2. Calcular Score Total
     total_score, margin = calc.calculate_score(averages)
@@ -106,7 +123,8 @@ def save_final_results(votes_dict: dict):
         "results": {
             "status": "finished",
             "averages": {**averages, "total_average": total_score},
-            "uncertainty_margin": margin
+            "uncertainty_margin": margin,
+            "model_version": calc.model_version
         }
     }, merge=True)
 
@@ -137,13 +155,21 @@ def sync_room_state():
 
 # --- Função de display avançado de resultados ---
 
-def display_discussion_results(voted_users, score, margin):
-    df_votes = pd.DataFrame.from_dict(voted_users, orient='index')
+def display_discussion_results(voted_users, score, margin, model_version=DEFAULT_MODEL_VERSION):
+    if not voted_users:
+        st.info("Nenhum voto válido para detalhar nesta tarefa.")
+        return
+
+    df_votes = pd.DataFrame.from_dict({k: v.model_dump() for k, v in voted_users.items()}, orient='index')
     
     # 1. Cálculo de Métricas de Discordância
-    # 'Score Final' deve ser calculado para cada linha (usuário)
-    calc = ComplexityCalculator(weights=METRICS_CONFIG)
-    df_votes['Score Final'] = df_votes.apply(lambda r: calc.calculate_score(r.to_dict())[0], axis=1)
+    # 'Score Final' deve ser calculado para cada linha (usuário), com o mesmo modelo do score salvo
+    try:
+        calc = ComplexityCalculator(model=scoring_registry.get(model_version))
+    except KeyError:
+        st.warning(f"Modelo de pontuação v{model_version} não está disponível; não é possível detalhar os votos.")
+        return
+    df_votes['Score Final'] = [calc.calculate_score(v.metrics())[0] for v in voted_users.values()]
 
     std_dev = df_votes['Score Final'].std()
     max_score = df_votes['Score Final'].max()
@@ -215,6 +241,36 @@ def display_discussion_results(voted_users, score, margin):
             use_container_width=True
         )
 
+# --- Recálculo do histórico em segundo plano ---
+
+# Job compartilhado entre sessões: sobrevive a reloads e evita jobs duplicados na mesma sala
+_current_job = rescore_jobs.get(room_ref.path)
+_rescore_polling = _current_job is not None and _current_job.running
+
+@st.fragment(run_every="1s" if _rescore_polling else None)
+def rescore_panel():
+    """Recalcula tarefas antigas com o modelo ativo (sem recalcular a cada visualização)."""
+    active_model = scoring_registry.active
+    st.caption(f"Modelo de pontuação ativo: v{active_model.version} (disponíveis: {scoring_registry.versions})")
+
+    rescore_job = rescore_jobs.get(room_ref.path)
+    if rescore_job is not None and rescore_job.running:
+        st.progress(rescore_job.progress, text=f"Recalculando com v{rescore_job.model.version}: {rescore_job.done}/{rescore_job.total}")
+        return
+
+    if _rescore_polling:
+        # Job terminou: rerun completo para parar o polling e exibir os novos scores
+        st.rerun()
+
+    if rescore_job is not None:
+        if rescore_job.error:
+            st.error(f"Falha ao recalcular: {rescore_job.error}")
+        else:
+            st.success(f"{rescore_job.done} tarefa(s) recalculada(s) com v{rescore_job.model.version}.")
+    if st.button(f"♻️ Recalcular Histórico com v{active_model.version}"):
+        rescore_jobs.start(room_ref.path, room_ref, active_model)
+        st.rerun()
+
 # --- Main Logic ---
 
 room_info = room_ref.get().to_dict()
@@ -238,6 +294,9 @@ if user_type == "owner":
                 room_ref.update({"current_task_id": new_task_name})
                 st.success(f"Tarefa alterada para {new_task_name}!")
                 st.rerun()
+
+        st.divider()
+        rescore_panel()
 else:
     st.info(f"📌 Tarefa Atual: **{db_current_task_id}**")
 
@@ -268,19 +327,29 @@ with st.sidebar:
     current_inputs = {"user_type": user_type}
     for key, conf in METRICS_CONFIG.items():
         if conf["type"] == "number":
-            current_inputs[key] = st.number_input(conf["display_name"], min_value=0.0, value=0.0)
+            current_inputs[key] = st.number_input(conf["display_name"], min_value=float(conf["min"]), max_value=float(conf["max"]), value=0.0)
         else:
             current_inputs[key] = st.select_slider(conf["display_name"], options=DISCRETE_SCALE, value=3)
 
     if st.button("🚀 Enviar Voto", disabled=(current_status == "finished")):
-        votes_ref.document(user_name).set(current_inputs)
-        st.success("Voto computado!")
+        try:
+            vote = Vote.model_validate(current_inputs)
+        except ValidationError as e:
+            st.error(f"Voto inválido: {e.error_count()} erro(s) de validação.")
+        else:
+            votes_ref.document(user_name).set(vote.model_dump())
+            st.success("Voto computado!")
 
 # Área Principal: Resultados
 st.divider()
 
 all_votes_docs = list(votes_ref.stream())
-voted_users = {doc.id: doc.to_dict() for doc in all_votes_docs}
+# Validação em lote dos votos lidos; documentos inválidos ficam fora do cálculo
+all_votes, rejected_votes = validate_votes([doc.to_dict() for doc in all_votes_docs])
+valid_votes_docs = [doc for i, doc in enumerate(all_votes_docs) if i not in rejected_votes]
+voted_users = {doc.id: vote for doc, vote in zip(valid_votes_docs, all_votes)}
+if rejected_votes:
+    st.warning(f"{len(rejected_votes)} voto(s) inválido(s) ignorado(s).")
 
 if current_status == "voting":
     st.info(f"🗳️ Status: **Em votação** ({len(voted_users)} votos)")
@@ -295,14 +364,21 @@ else:
     averages = res["averages"]
     score = averages["total_average"]
     margin = res.get("uncertainty_margin", 0)
+    # Resultados anteriores ao registro de modelos foram calculados com o modelo embutido
+    model_version = res.get("model_version", DEFAULT_MODEL_VERSION)
     
     category, bg_color, fib = get_fibonacci_class(score)
 
     m_col1, m_col2, m_col3 = st.columns(3)
-    m_col1.metric("Média EuSEI", f"{score:.2f}")
+    m_col1.metric("Média EuSEI", f"{score:.2f}", help=f"Modelo de pontuação v{model_version}")
     m_col2.metric("Incerteza", f"± {margin}%")
     m_col3.markdown(f'<div style="background-color:{bg_color}; color:black; padding:10px; border-radius:10px; text-align:center;"><b>{category} ({fib})</b></div>', unsafe_allow_html=True)
 
+    active_version = scoring_registry.active.version
+    rescored = res.get("rescores", {}).get(str(active_version))
+    if active_version != model_version and rescored:
+        st.caption(f"Score v{model_version}: {score:.2f} · Recalculado com v{active_version}: {rescored['total_average']:.2f} (± {rescored['uncertainty_margin']}%)")
+
     with st.expander("📊 Detalhamento Técnico"):
         st.write("### Médias por critério:")
         # Preparar dados (remover o score total para não poluir o gráfico de critérios)
@@ -349,7 +425,7 @@ else:
                 )
 
         # Aqui você pode chamar sua função display_advanced_results do código original
-        display_discussion_results(voted_users, score, margin)
+        display_discussion_results(voted_users, score, margin, model_version)
 
     if st.button("🆕 Iniciar Nova Task"):
         # Apenas limpa o ID da sessão para criar um novo documento em /tasks/
@@ -1,22 +1,12 @@
-import numpy as np
-import logging
-
-from typing import Dict, Any, Optional, Final
-
-# Configuration Constants
-MAX_HOURS: Final[float] = 160.0
-BASE_SCALE: Final[float] = 10.0
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
 import numpy as np
 import logging
 from typing import Dict, Any, Optional, Final, Tuple
 
-# Configuration Constants
-MAX_HOURS: Final[float] = 160.0
-BASE_SCALE: Final[float] = 10.0
+from src.scoring import ScoringModel, DEFAULT_MODEL_VERSION, DEFAULT_MAX_HOURS, DEFAULT_BASE_SCALE
+
+# Configuration Constants (caps of the built-in model; see src/scoring.py)
+MAX_HOURS: Final[float] = DEFAULT_MAX_HOURS
+BASE_SCALE: Final[float] = DEFAULT_BASE_SCALE
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,26 +17,39 @@ class ComplexityCalculator:
     weighted geometric normalization.
     """
     
-    def __init__(self, weights: Dict[str, Any]):
-        # Store the full config dictionary to access the 'weight' sub-key
-        if not weights:
-            raise ValueError("Weights configuration cannot be empty.")
-        self.weights_config = weights
+    def __init__(self, weights: Optional[Dict[str, Any]] = None, model: Optional[ScoringModel] = None):
+        # Either a versioned scoring model or a METRICS_CONFIG-like dict (built-in curve and caps)
+        if model is not None and weights is not None:
+            raise ValueError("Pass either weights or model, not both.")
+        if model is None:
+            if not weights:
+                raise ValueError("Weights configuration cannot be empty.")
+            model = ScoringModel(
+                version=DEFAULT_MODEL_VERSION,
+                weights={k: v["weight"] for k, v in weights.items()},
+            )
+        self.model = model
+        self.weights_config = model.weights
+        self._index = {k: i for i, k in enumerate(model.metric_keys)}
+
+    @property
+    def model_version(self) -> int:
+        return self.model.version
         
     def _apply_non_linear_scaling(self, raw_score: float) -> float:
         """
         Applies an exponential curve to the score. 
         Ensures that a '10' in difficulty feels significantly heavier than a '5'.
-        Formula: Result = (Score^1.5)
+        Formula: Result = (Score^curve_exponent), 1.5 in the built-in model
         """
-        return np.power(raw_score, 1.5)
+        return np.power(raw_score, self.model.curve_exponent)
 
     def calculate_score(self, inputs: Dict[str, float]) -> Tuple[float, float]:
         """
         Calculates a production-grade complexity score.
         
         Args:
-            inputs: Raw metric values (0-10 for levels, 0-MAX_HOURS for hours).
+            inputs: Raw metric values (0-10 for levels, 0-max_hours for hours).
             
         Returns:
             Tuple containing (score, margin).
@@ -62,28 +65,26 @@ class ComplexityCalculator:
         if num_metrics == 0:
             return 0.0, 100.0
 
-        # 2. Normalize Hours (Capping at MAX_HOURS)
+        # 2. Normalize Hours (Capping at the model's max_hours)
         # We modify a copy to avoid side effects on the input dict
         processed_values = valid_metrics.copy()
         if "hours" in processed_values:
             raw_hours = processed_values["hours"]
-            processed_values["hours"] = min((raw_hours / MAX_HOURS) * BASE_SCALE, BASE_SCALE)
+            base_scale = self.model.base_scale
+            processed_values["hours"] = min((raw_hours / self.model.max_hours) * base_scale, base_scale)
 
         # 3. Calculate Weighted Linear Base
-        values = []
-        applied_weights = []
-        
-        for key, val in processed_values.items():
-            values.append(val)
-            # Access the 'weight' float inside the config dict
-            applied_weights.append(self.weights_config[key]["weight"])
+        values = np.fromiter(processed_values.values(), dtype=float, count=num_metrics)
+        # Pick the compiled weights of the metrics present
+        idx = np.fromiter((self._index[k] for k in processed_values), dtype=int, count=num_metrics)
+        applied_weights = self.model.compiled_weights[idx]
 
         # Normalize weights in case some metrics are missing (subset calculation)
-        weight_sum = sum(applied_weights)
+        weight_sum = applied_weights.sum()
         if weight_sum == 0:
             return 0.0, 100.0
             
-        normalized_weights = np.array(applied_weights) / weight_sum
+        normalized_weights = applied_weights / weight_sum
         base_score = np.average(values, weights=normalized_weights)
 
         # 4. Redistribution (Non-linear Step)
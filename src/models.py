@@ -1,11 +1,84 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, create_model, field_validator
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Literal, Tuple
 
+from src.config import METRICS_CONFIG, DISCRETE_SCALE
 
-class MetricInput(BaseModel):
-    hours: Optional[float] = None
-    technical_complexity: Optional[int] = Field(None, ge=1, le=10)
-    manual_effort: Optional[int] = Field(None, ge=1, le=10)
-    uncertainty_level: Optional[int] = Field(None, ge=1, le=10)
-    
\ No newline at end of file
+
+def _metric_field(conf: Dict[str, Any], required: bool) -> Tuple[Any, Any]:
+    """Builds the (type, Field) pair of a metric from its METRICS_CONFIG entry."""
+    if conf["type"] != "number" and required:
+        # A ballot slider can only send DISCRETE_SCALE steps (whose top may exceed the configured max)
+        return Literal[tuple(DISCRETE_SCALE)], Field(..., description=conf["description"])
+    if conf["type"] == "number":
+        kind, upper = float, conf["max"]
+    else:
+        kind, upper = int, max(conf["max"], max(DISCRETE_SCALE))
+    if required:
+        return kind, Field(..., ge=conf["min"], le=upper, description=conf["description"])
+    return Optional[kind], Field(None, ge=conf["min"], le=upper, description=conf["description"])
+
+
+# Metric values of a (possibly partial) input, one field per METRICS_CONFIG key
+MetricInput = create_model(
+    "MetricInput",
+    __config__=ConfigDict(extra="ignore"),
+    **{key: _metric_field(conf, required=False) for key, conf in METRICS_CONFIG.items()},
+)
+
+
+class _VoteBase(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    user_type: Literal["owner", "squad"] = "squad"
+
+    def metrics(self) -> Dict[str, float]:
+        """Metric values only, ready for ComplexityCalculator.calculate_score."""
+        return self.model_dump(exclude={"user_type"})
+
+
+# A voter's ballot: the widget always sends every metric, so all of them are required
+Vote = create_model(
+    "Vote",
+    __base__=_VoteBase,
+    **{key: _metric_field(conf, required=True) for key, conf in METRICS_CONFIG.items()},
+)
+
+
+_NUMBER_METRICS = [key for key, conf in METRICS_CONFIG.items() if conf["type"] == "number"]
+
+
+class StoredVote(Vote):
+    """
+    Read model for votes already in Firestore.
+    Votes cast before the hours input had an upper bound may exceed the configured
+    max; they are clamped to it instead of being dropped. Models capping hours at
+    or below that max (the built-in one caps at 160h) score them the same.
+    """
+
+    @field_validator(*_NUMBER_METRICS, mode="before")
+    @classmethod
+    def _clamp_legacy_numbers(cls, value: Any, info) -> Any:
+        upper = METRICS_CONFIG[info.field_name]["max"]
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > upper:
+            return upper
+        return value
+
+
+# Built once: validates whole lists of stored votes in a single compiled pass
+VOTES_ADAPTER: TypeAdapter = TypeAdapter(List[StoredVote])
+
+
+def validate_votes(raw_votes: List[Dict[str, Any]]) -> Tuple[List[StoredVote], List[int]]:
+    """
+    Validates a batch of raw vote dicts read from Firestore.
+
+    Returns:
+        Tuple containing (valid votes, indexes of the rejected raw votes).
+    """
+    try:
+        return VOTES_ADAPTER.validate_python(raw_votes), []
+    except ValidationError as e:
+        rejected = sorted({err["loc"][0] for err in e.errors()})
+        kept = [v for i, v in enumerate(raw_votes) if i not in rejected]
+        return VOTES_ADAPTER.validate_python(kept), rejected
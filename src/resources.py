@@ -0,0 +1,15 @@
+import streamlit as st
+
+from src.scoring import ScoringModelRegistry, RescoreJobRegistry
+
+
+# Shared across pages and sessions: one cached instance per process
+
+@st.cache_resource
+def get_scoring_registry() -> ScoringModelRegistry:
+    return ScoringModelRegistry()
+
+
+@st.cache_resource
+def get_rescore_jobs() -> RescoreJobRegistry:
+    return RescoreJobRegistry()
@@ -0,0 +1,245 @@
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Tuple, Final
+
+from src.config import METRICS_CONFIG
+
+# Defaults of the built-in model (version 1)
+DEFAULT_MODEL_VERSION: Final[int] = 1
+DEFAULT_CURVE_EXPONENT: Final[float] = 1.5
+DEFAULT_MAX_HOURS: Final[float] = 160.0
+DEFAULT_BASE_SCALE: Final[float] = 10.0
+
+# Directory scanned for model files (one JSON file per version)
+MODELS_DIR: Final[Path] = Path(os.getenv("EUSEI_SCORING_MODELS_DIR", "scoring_models"))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScoringModel:
+    """
+    A versioned scoring model: weights, non-linear curve and caps.
+    Weights are compiled once into an array aligned with `metric_keys`.
+    """
+    version: int
+    weights: Dict[str, float]
+    curve_exponent: float = DEFAULT_CURVE_EXPONENT
+    max_hours: float = DEFAULT_MAX_HOURS
+    base_scale: float = DEFAULT_BASE_SCALE
+    metric_keys: Tuple[str, ...] = field(init=False, compare=False)
+    compiled_weights: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.weights:
+            raise ValueError("Weights configuration cannot be empty.")
+        unknown = set(self.weights) - set(METRICS_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown metrics in scoring model v{self.version}: {sorted(unknown)}")
+        if self.max_hours <= 0 or self.base_scale <= 0:
+            raise ValueError("max_hours and base_scale must be positive.")
+        if not np.isfinite(self.curve_exponent) or self.curve_exponent <= 0:
+            raise ValueError("curve_exponent must be a positive number.")
+
+        keys = tuple(self.weights.keys())
+        compiled = np.array([float(self.weights[k]) for k in keys])
+        if not np.all(np.isfinite(compiled)) or np.any(compiled < 0):
+            raise ValueError(f"Weights of scoring model v{self.version} must be non-negative numbers.")
+        if compiled.sum() <= 0:
+            raise ValueError(f"Weights of scoring model v{self.version} must not sum to zero.")
+
+        object.__setattr__(self, "metric_keys", keys)
+        object.__setattr__(self, "compiled_weights", compiled)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScoringModel":
+        if not isinstance(data, dict):
+            raise ValueError("Scoring model must be a JSON object.")
+        version = data.get("version")
+        # Stored scores are keyed by version, so no coercion: 2.7 or true must not become v2 or v1
+        if not isinstance(version, int) or isinstance(version, bool) or version < 1:
+            raise ValueError(f"Scoring model version must be a positive integer, got {version!r}.")
+        if not isinstance(data.get("weights"), dict):
+            raise ValueError(f"Weights of scoring model v{version} must be a JSON object.")
+        return cls(
+            version=version,
+            weights={k: float(v) for k, v in data["weights"].items()},
+            curve_exponent=float(data.get("curve_exponent", DEFAULT_CURVE_EXPONENT)),
+            max_hours=float(data.get("max_hours", DEFAULT_MAX_HOURS)),
+            base_scale=float(data.get("base_scale", DEFAULT_BASE_SCALE)),
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ScoringModel":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def default_model() -> ScoringModel:
+    """Built-in model, equivalent to the original hard-coded scoring."""
+    return ScoringModel(
+        version=DEFAULT_MODEL_VERSION,
+        weights={k: v["weight"] for k, v in METRICS_CONFIG.items()},
+    )
+
+
+class ScoringModelRegistry:
+    """
+    Holds every known scoring model by version.
+    Model files (*.json) in `models_dir` are read whenever they are added or
+    changed, so new versions are picked up without restarting the process.
+    Once loaded, a version is immutable: it stays available even if its file is
+    removed or broken, and files redefining it with other content are ignored.
+    The active model is the highest version available.
+    """
+
+    def __init__(self, models_dir: Path = MODELS_DIR):
+        self.models_dir = Path(models_dir)
+        builtin = default_model()
+        self._models: Dict[int, ScoringModel] = {builtin.version: builtin}
+        self._mtimes: Dict[Path, float] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Loads model files added or changed since the last call. Returns True if a new version was loaded."""
+        files = {}
+        if self.models_dir.is_dir():
+            for path in self.models_dir.glob("*.json"):
+                try:
+                    files[path] = path.stat().st_mtime
+                except OSError:
+                    continue
+
+        with self._lock:
+            changed = sorted(p for p, mtime in files.items() if self._mtimes.get(p) != mtime)
+            self._mtimes = files
+            # Copy-on-write: readers iterate the current dict without taking the lock
+            models = dict(self._models)
+            loaded = []
+
+            for path in changed:
+                try:
+                    model = ScoringModel.from_file(path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    # A broken file must not take down the models already in use
+                    logger.warning(f"Ignoring scoring model file {path}: {e}")
+                    continue
+
+                current = models.get(model.version)
+                if current is None:
+                    models[model.version] = model
+                    loaded.append(model.version)
+                elif current != model:
+                    # Stored scores reference versions, so a version must never change meaning
+                    logger.warning(f"Ignoring scoring model file {path}: v{model.version} is already loaded with different content")
+
+            if loaded:
+                self._models = models
+                logger.info(f"Scoring models loaded: {sorted(loaded)} (available: {self.versions})")
+            return bool(loaded)
+
+    @property
+    def versions(self) -> list:
+        return sorted(self._models)
+
+    @property
+    def active(self) -> ScoringModel:
+        models = self._models
+        return models[max(models)]
+
+    def get(self, version: Optional[int] = None) -> ScoringModel:
+        """Returns the model for `version`, or the active one when omitted."""
+        if version is None:
+            return self.active
+        try:
+            return self._models[int(version)]
+        except KeyError:
+            raise KeyError(f"Unknown scoring model version: {version}") from None
+
+
+class RescoreJobRegistry:
+    """
+    Tracks rescore jobs per room so that every session sees the same job
+    and a room never runs two jobs at once.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, RescoreJob] = {}
+        self._lock = threading.Lock()
+
+    def get(self, room_key: str) -> Optional["RescoreJob"]:
+        return self._jobs.get(room_key)
+
+    def start(self, room_key: str, room_ref, model: ScoringModel) -> "RescoreJob":
+        """Starts a job for the room, or returns the one already running."""
+        with self._lock:
+            job = self._jobs.get(room_key)
+            if job is None or not job.running:
+                job = self._jobs[room_key] = RescoreJob(room_ref, model).start()
+            return job
+
+
+class RescoreJob:
+    """
+    Background batch job that re-scores finished tasks of a room against a model.
+    New scores are stored next to the original one under `results.rescores.<version>`,
+    so historical scores keep reading as they were computed.
+    """
+
+    def __init__(self, room_ref, model: ScoringModel):
+        self.room_ref = room_ref
+        self.model = model
+        self.total = 0
+        self.done = 0
+        self.error: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "RescoreJob":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        # Imported here to avoid a circular import (calculator depends on this module)
+        from src.calculator import ComplexityCalculator
+
+        calc = ComplexityCalculator(model=self.model)
+        try:
+            tasks = [t for t in self.room_ref.collection("tasks").stream()
+                     if (t.to_dict() or {}).get("results", {}).get("status") == "finished"]
+            self.total = len(tasks)
+
+            for task in tasks:
+                averages = task.to_dict()["results"].get("averages", {})
+                criteria = {k: v for k, v in averages.items() if k != "total_average"}
+                score, margin = calc.calculate_score(criteria)
+                task.reference.set({
+                    "results": {
+                        "rescores": {
+                            str(self.model.version): {
+                                "total_average": score,
+                                "uncertainty_margin": margin,
+                            }
+                        }
+                    }
+                }, merge=True)
+                self.done += 1
+        except Exception as e:
+            logger.exception("Rescore job failed")
+            self.error = str(e)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from src.calculator import ComplexityCalculator
+from src.config import METRICS_CONFIG
+from src.scoring import default_model
+
+
+def legacy_calculate_score(inputs):
+    """Hard-coded scoring as it was before scoring models (reference implementation)."""
+    valid = {k: float(v) for k, v in inputs.items() if k in METRICS_CONFIG and v is not None}
+    if not valid:
+        return 0.0, 100.0
+    if "hours" in valid:
+        valid["hours"] = min((valid["hours"] / 160.0) * 10.0, 10.0)
+    weights = [METRICS_CONFIG[k]["weight"] for k in valid]
+    if sum(weights) == 0:
+        return 0.0, 100.0
+    base = np.average(list(valid.values()), weights=np.array(weights) / sum(weights))
+    margin = max(5.0, (1 - np.sqrt(len(valid) / len(METRICS_CONFIG))) * 100)
+    return round(float(np.power(base, 1.5)), 2), round(float(margin), 2)
+
+
+@pytest.mark.parametrize("inputs", [
+    {"hours": 80, "tech_complexity": 5, "manual_effort": 3, "uncertainty": 8},
+    {"hours": 400, "tech_complexity": 13, "manual_effort": 1, "uncertainty": 1},
+    {"hours": 0, "tech_complexity": 1, "manual_effort": 1, "uncertainty": 1},
+    {"tech_complexity": 5, "uncertainty": None},
+    {"uncertainty": 8, "user_type": "owner"},
+    {},
+])
+def test_builtin_model_matches_legacy_scoring(inputs):
+    expected = legacy_calculate_score(inputs)
+    assert ComplexityCalculator(weights=METRICS_CONFIG).calculate_score(inputs) == expected
+    assert ComplexityCalculator(model=default_model()).calculate_score(inputs) == expected
+
+
+def test_weights_follow_input_order():
+    calc = ComplexityCalculator(weights=METRICS_CONFIG)
+    inputs = {"uncertainty": 9, "hours": 16, "tech_complexity": 2}
+    reordered = dict(reversed(list(inputs.items())))
+    assert calc.calculate_score(inputs) == calc.calculate_score(reordered) == legacy_calculate_score(inputs)
+
+
+def test_empty_weights_rejected():
+    with pytest.raises(ValueError):
+        ComplexityCalculator(weights={})
+
+
+def test_weights_and_model_are_exclusive():
+    with pytest.raises(ValueError):
+        ComplexityCalculator(weights=METRICS_CONFIG, model=default_model())
@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+
+from src.calculator import ComplexityCalculator
+from src.config import METRICS_CONFIG
+from src.models import MetricInput, Vote, StoredVote, validate_votes
+
+VOTE = {"user_type": "squad", "hours": 24.0, "tech_complexity": 5, "manual_effort": 3, "uncertainty": 8}
+
+
+def test_vote_fields_match_metrics_config():
+    assert set(Vote.model_fields) == set(METRICS_CONFIG) | {"user_type"}
+    assert set(MetricInput.model_fields) == set(METRICS_CONFIG)
+
+
+def test_vote_metrics_exclude_user_type():
+    vote = Vote.model_validate({**VOTE, "extra_field": 1})
+    assert vote.metrics() == {"hours": 24.0, "tech_complexity": 5, "manual_effort": 3, "uncertainty": 8}
+    assert ComplexityCalculator(weights=METRICS_CONFIG).calculate_score(vote.metrics()) == \
+        ComplexityCalculator(weights=METRICS_CONFIG).calculate_score(VOTE)
+
+
+def test_slider_accepts_top_of_discrete_scale():
+    assert Vote.model_validate({**VOTE, "tech_complexity": 13}).tech_complexity == 13
+
+
+@pytest.mark.parametrize("value", [4, 6, 11])
+def test_slider_rejects_off_scale_values(value):
+    with pytest.raises(ValidationError):
+        Vote.model_validate({**VOTE, "uncertainty": value})
+
+
+@pytest.mark.parametrize("raw", [
+    {},
+    {"foo": 1},
+    {**VOTE, "hours": None},
+    {k: v for k, v in VOTE.items() if k != "uncertainty"},
+    {**VOTE, "hours": -1.0},
+    {**VOTE, "hours": 500.0},
+    {**VOTE, "tech_complexity": 0},
+    {**VOTE, "user_type": "admin"},
+])
+def test_invalid_votes_rejected(raw):
+    with pytest.raises(ValidationError):
+        Vote.model_validate(raw)
+
+
+def test_metric_input_allows_partial_values():
+    assert MetricInput.model_validate({"hours": 10}).model_dump(exclude_none=True) == {"hours": 10.0}
+
+
+def test_stored_votes_clamp_legacy_hours():
+    assert StoredVote.model_validate({**VOTE, "hours": 500.0}).hours == METRICS_CONFIG["hours"]["max"]
+    with pytest.raises(ValidationError):
+        StoredVote.model_validate({**VOTE, "hours": -1.0})
+
+
+def test_validate_votes_keeps_legacy_out_of_range_hours():
+    votes, rejected = validate_votes([{**VOTE, "hours": 320.0}])
+    assert rejected == []
+    calc = ComplexityCalculator(weights=METRICS_CONFIG)
+    assert calc.calculate_score(votes[0].metrics()) == calc.calculate_score({**VOTE, "hours": 320.0})
+
+
+def test_validate_votes_skips_invalid_entries():
+    votes, rejected = validate_votes([VOTE, {}, {**VOTE, "tech_complexity": "x"}, {**VOTE, "user_type": "owner"}])
+    assert rejected == [1, 2]
+    assert [v.user_type for v in votes] == ["squad", "owner"]
+
@@ -0,0 +1,197 @@
+import json
+import os
+
+import pytest
+
+from src.calculator import ComplexityCalculator
+from src.scoring import ScoringModel, ScoringModelRegistry, RescoreJob, RescoreJobRegistry
+
+V2 = {"version": 2, "weights": {"hours": 0.5, "tech_complexity": 0.5}, "curve_exponent": 2.0}
+
+
+def write_model(path, data, mtime=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize("changes", [
+    {"weights": {"hours": -1.0, "tech_complexity": 2.0}},
+    {"weights": {"hours": 0.0, "tech_complexity": 0.0}},
+    {"weights": {"hours": float("nan")}},
+    {"weights": {"unknown_metric": 1.0}},
+    {"weights": {}},
+    {"curve_exponent": 0.0},
+    {"curve_exponent": -1.5},
+    {"max_hours": 0.0},
+])
+def test_invalid_models_rejected(changes):
+    with pytest.raises(ValueError):
+        ScoringModel.from_dict({**V2, **changes})
+
+
+@pytest.mark.parametrize("data", [
+    [],
+    None,
+    "v2",
+    {**V2, "weights": [0.5, 0.5]},
+    {**V2, "weights": None},
+    {k: v for k, v in V2.items() if k != "weights"},
+])
+def test_malformed_models_rejected(data):
+    with pytest.raises(ValueError):
+        ScoringModel.from_dict(data)
+
+
+@pytest.mark.parametrize("version", [2.7, 2.0, "2", True, False, 0, -1, None])
+def test_non_positive_integer_versions_rejected(version):
+    with pytest.raises(ValueError):
+        ScoringModel.from_dict({**V2, "version": version})
+
+
+def test_registry_starts_with_builtin_model(tmp_path):
+    registry = ScoringModelRegistry(tmp_path / "missing")
+    assert registry.versions == [1]
+    assert registry.active.curve_exponent == 1.5
+
+
+def test_registry_loads_new_files_without_restart(tmp_path):
+    registry = ScoringModelRegistry(tmp_path)
+    write_model(tmp_path / "v2.json", V2)
+
+    assert registry.refresh()
+    assert registry.versions == [1, 2]
+    assert registry.active.version == 2
+    assert not registry.refresh()
+
+
+def test_registry_keeps_versions_of_removed_or_broken_files(tmp_path):
+    write_model(tmp_path / "v2.json", V2, mtime=1000)
+    registry = ScoringModelRegistry(tmp_path)
+
+    (tmp_path / "v2.json").write_text("{not json", encoding="utf-8")
+    os.utime(tmp_path / "v2.json", (2000, 2000))
+    registry.refresh()
+    assert registry.get(2).curve_exponent == 2.0
+
+    (tmp_path / "v2.json").unlink()
+    registry.refresh()
+    assert registry.versions == [1, 2]
+
+
+def test_registry_ignores_redefined_versions(tmp_path):
+    write_model(tmp_path / "v2.json", V2, mtime=1000)
+    registry = ScoringModelRegistry(tmp_path)
+
+    write_model(tmp_path / "v2.json", {**V2, "curve_exponent": 3.0}, mtime=2000)
+    write_model(tmp_path / "z_v2_copy.json", {**V2, "max_hours": 80.0})
+    write_model(tmp_path / "v1.json", {**V2, "version": 1})
+    assert not registry.refresh()
+
+    assert registry.get(2) == ScoringModel.from_dict(V2)
+    assert registry.get(1).curve_exponent == 1.5
+
+
+def test_registry_ignores_invalid_files(tmp_path):
+    write_model(tmp_path / "v3.json", {**V2, "version": 3, "curve_exponent": -1.0})
+    registry = ScoringModelRegistry(tmp_path)
+    assert registry.versions == [1]
+
+
+@pytest.mark.parametrize("data", [[V2], {**V2, "weights": [0.5, 0.5]}, {**V2, "weights": None}, {**V2, "version": True}])
+def test_registry_ignores_malformed_files(tmp_path, data):
+    write_model(tmp_path / "bad.json", data)
+    registry = ScoringModelRegistry(tmp_path)
+    assert registry.versions == [1]
+
+    write_model(tmp_path / "v2.json", V2)
+    assert registry.refresh()
+    assert registry.versions == [1, 2]
+
+
+def test_unknown_version_raises_key_error(tmp_path):
+    with pytest.raises(KeyError):
+        ScoringModelRegistry(tmp_path).get(99)
+
+
+class FakeTaskRef:
+    def __init__(self):
+        self.writes = []
+
+    def set(self, data, merge=False):
+        self.writes.append((data, merge))
+
+
+class FakeTask:
+    def __init__(self, data):
+        self._data = data
+        self.reference = FakeTaskRef()
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def stream(self):
+        return iter(self._docs)
+
+
+class FakeRoomRef:
+    def __init__(self, tasks):
+        self.tasks = tasks
+
+    def collection(self, name):
+        assert name == "tasks"
+        return FakeCollection(self.tasks)
+
+
+def finished_task(**averages):
+    return FakeTask({"results": {"status": "finished", "averages": {**averages, "total_average": 0.0}}})
+
+
+def test_rescore_job_writes_rescores_and_tracks_progress():
+    model = ScoringModel.from_dict(V2)
+    tasks = [
+        finished_task(hours=80.0, tech_complexity=5.0, manual_effort=3.0, uncertainty=8.0),
+        finished_task(hours=16.0, tech_complexity=2.0, manual_effort=1.0, uncertainty=1.0),
+        FakeTask({"results": {"status": "voting"}}),
+    ]
+    job = RescoreJob(FakeRoomRef(tasks), model).start()
+    job._thread.join(timeout=5)
+
+    assert not job.running and job.error is None
+    assert (job.done, job.total, job.progress) == (2, 2, 1.0)
+
+    calc = ComplexityCalculator(model=model)
+    for task in tasks[:2]:
+        criteria = {k: v for k, v in task.to_dict()["results"]["averages"].items() if k != "total_average"}
+        score, margin = calc.calculate_score(criteria)
+        assert task.reference.writes == [({"results": {"rescores": {"2": {
+            "total_average": score, "uncertainty_margin": margin,
+        }}}}, True)]
+    assert tasks[2].reference.writes == []
+
+
+def test_rescore_job_records_errors():
+    class BrokenRoomRef:
+        def collection(self, name):
+            raise RuntimeError("firestore unavailable")
+
+    job = RescoreJob(BrokenRoomRef(), ScoringModel.from_dict(V2)).start()
+    job._thread.join(timeout=5)
+    assert job.error == "firestore unavailable"
+
+
+def test_rescore_job_registry_does_not_duplicate_running_jobs(monkeypatch):
+    monkeypatch.setattr(RescoreJob, "running", property(lambda self: True))
+    monkeypatch.setattr(RescoreJob, "start", lambda self: self)
+    jobs = RescoreJobRegistry()
+    model = ScoringModel.from_dict(V2)
+
+    first = jobs.start("rooms/a", FakeRoomRef([]), model)
+    assert jobs.start("rooms/a", FakeRoomRef([]), model) is first
+    assert jobs.start("rooms/b", FakeRoomRef([]), model) is not first
+    assert jobs.get("rooms/a") is first